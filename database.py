@@ -22,7 +22,15 @@ database_url = os.getenv("DATABASE_URL")
 database_name = os.getenv("DATABASE_NAME")
 
 if database_url and database_name:
-    _client = MongoClient(database_url)
+    # pooled, compressed connections; tz_aware so stored datetimes come back as UTC
+    _client = MongoClient(
+        database_url,
+        maxPoolSize=100,
+        minPoolSize=10,
+        compressors="zstd,zlib",
+        zlibCompressionLevel=-1,
+        tz_aware=True,
+    )
     db = _client[database_name]
 
 # Helper functions for common database operations
@@ -1,17 +1,42 @@
+import logging
 import os
+import codecs
 import csv
-import io
 import random
+import re
+import threading
+import time
+from collections import deque
 from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 
-from fastapi import FastAPI, UploadFile, File, Form, BackgroundTasks, HTTPException
+from fastapi import FastAPI, UploadFile, File, Form, BackgroundTasks, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
+import orjson
+import pymongo
+import redis
 
 from database import db, create_document, get_documents
 
-app = FastAPI()
+
+# stored datetimes are UTC; emit them as ISO 8601 with a Z suffix
+JSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+
+class UTCJSONResponse(ORJSONResponse):
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=JSON_OPTIONS)
+
+
+logger = logging.getLogger(__name__)
+
+app = FastAPI(default_response_class=UTCJSONResponse)
+
+# Optional Redis, shared by the read cache and the automation queue
+redis_url = os.getenv("REDIS_URL")
 
 app.add_middleware(
     CORSMiddleware,
@@ -22,8 +47,48 @@ app.add_middleware(
 )
 
 
+# ---------------------- Indexes ----------------------
+INDEXES = [
+    ("prospect", [("campaign_id", 1), ("status", 1), ("last_action_at", 1)], {}),
+    ("prospect", [("campaign_id", 1), ("created_at", -1)], {}),
+    # inbox: only replied prospects, already in the order the endpoint returns them
+    ("prospect", [("updated_at", -1)], {"partialFilterExpression": {"status": "replied"}, "name": "inbox_replied_sort"}),
+    # follow-up candidates only: keeps the automation index small
+    ("prospect", [("campaign_id", 1), ("last_action_at", 1)], {"partialFilterExpression": {"status": "requested"}}),
+    ("company", [("campaign_id", 1), ("company_name", 1)], {}),
+    ("template", [("campaign_id", 1)], {"unique": True}),
+    ("messagelog", [("campaign_id", 1), ("prospect_id", 1)], {}),
+]
+
+
+def ensure_indexes():
+    for collection, keys, options in INDEXES:
+        try:
+            db[collection].create_index(keys, background=True, **options)
+        except Exception as e:
+            # a missing index only costs speed; don't keep the app (and /test) from starting
+            logger.warning("Could not create index %s on %s: %s", keys, collection, e)
+
+
+# ---------------------- Startup ----------------------
+@app.on_event("startup")
+def warm_database():
+    if db is None:
+        return
+    try:
+        # open the pool before the first request instead of on it
+        with pymongo.timeout(5):
+            db.command("ping")
+    except Exception as e:
+        # boot anyway so /test can report the problem; indexes are retried on the next start
+        logger.warning("MongoDB warm-up failed, skipping index creation: %s", e)
+        return
+    ensure_indexes()
+
+
 # ---------------------- Utility helpers ----------------------
 from bson import ObjectId
+from pymongo import InsertOne, UpdateOne
 
 def oid(val: str) -> ObjectId:
     try:
@@ -34,26 +99,90 @@ def oid(val: str) -> ObjectId:
 def serialize(doc):
     if not doc:
         return doc
-    d = dict(doc)
-    if "_id" in d:
-        d["id"] = str(d.pop("_id"))
-    # convert datetimes
-    for k, v in list(d.items()):
-        if isinstance(v, datetime):
-            d[k] = v.isoformat()
-    return d
+    # docs come fresh from a cursor, so rename _id in place; datetimes are left to orjson
+    if "_id" in doc:
+        doc["id"] = str(doc.pop("_id"))
+    return doc
+
+
+# Fields returned by the list endpoints; anything else stored on the documents stays on the server.
+COMPANY_FIELDS = {"campaign_id": 1, "company_name": 1, "linkedin_url": 1, "created_at": 1, "updated_at": 1}
+PROSPECT_FIELDS = {
+    "campaign_id": 1, "company_name": 1, "first_name": 1, "last_name": 1, "job_title": 1,
+    "profile_url": 1, "personalized_line": 1, "status": 1,
+    "created_at": 1, "updated_at": 1, "last_action_at": 1,
+}
+# Prospect fields render_template reads; used by the automation cursors
+RENDER_FIELDS = {"_id": 1, "first_name": 1, "company_name": 1, "job_title": 1, "personalized_line": 1}
+
+
+def stream_json(cursor) -> StreamingResponse:
+    # encode the cursor into a JSON array document by document instead of building a list;
+    # the first document is fetched up front so query errors surface before the 200 is sent
+    first = next(cursor, None)
+
+    def generate():
+        yield b"["
+        if first is not None:
+            yield orjson.dumps(serialize(first), option=JSON_OPTIONS)
+            for doc in cursor:
+                yield b"," + orjson.dumps(serialize(doc), option=JSON_OPTIONS)
+        yield b"]"
+    return StreamingResponse(generate(), media_type="application/json")
+
+
+# Read cache. With REDIS_URL set, entries live in Redis and are shared by every worker;
+# otherwise they are kept in-process, where short TTLs bound staleness across workers and
+# write endpoints drop the affected keys so the local worker sees its own writes.
+# Handlers run on the threadpool, so every in-process access goes through _cache_lock.
+CACHE_PREFIX = "llm:"
+_redis = redis.Redis.from_url(redis_url) if redis_url else None
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+def cached(key: str, expire: int, loader):
+    if _redis is not None:
+        raw = _redis.get(CACHE_PREFIX + key)
+        if raw is not None:
+            return orjson.loads(raw)
+        value = loader()
+        _redis.set(CACHE_PREFIX + key, orjson.dumps(value, option=JSON_OPTIONS), ex=expire)
+        return value
+    now = time.monotonic()
+    with _cache_lock:
+        hit = _cache.get(key)
+    if hit and hit[0] > now:
+        return hit[1]
+    value = loader()
+    with _cache_lock:
+        for k in [k for k, (expires, _) in _cache.items() if expires <= now]:
+            del _cache[k]
+        _cache[key] = (now + expire, value)
+    return value
+
+
+def invalidate(*keys: str):
+    if _redis is not None:
+        _redis.delete(*(CACHE_PREFIX + key for key in keys))
+        return
+    with _cache_lock:
+        for key in keys:
+            _cache.pop(key, None)
+
+
+_PLACE_RE = re.compile(r"\{\{(First Name|Company Name|Job Title|Personalized Line)\}\}")
+_KEY_MAP = {
+    "First Name": "first_name",
+    "Company Name": "company_name",
+    "Job Title": "job_title",
+    "Personalized Line": "personalized_line",
+}
 
 
 def render_template(template: str, data: dict) -> str:
-    # simple placeholder replacement
-    for key, value in {
-        "First Name": data.get("first_name", ""),
-        "Company Name": data.get("company_name", ""),
-        "Job Title": data.get("job_title", ""),
-        "Personalized Line": data.get("personalized_line", ""),
-    }.items():
-        template = template.replace(f"{{{{{key}}}}}", str(value or ""))
-    return template
+    # single-pass placeholder replacement
+    return _PLACE_RE.sub(lambda m: str(data.get(_KEY_MAP[m.group(1)]) or ""), template)
 
 
 # ---------------------- Models ----------------------
@@ -115,44 +244,78 @@ def create_campaign(payload: CampaignCreate):
         "updated_at": datetime.now(timezone.utc),
     }
     new_id = db["campaign"].insert_one(doc).inserted_id
+    invalidate("campaigns")
     return {"id": str(new_id), "name": payload.name, "description": payload.description}
 
 
 @app.get("/api/campaigns")
 def list_campaigns():
-    items = [serialize(x) for x in db["campaign"].find().sort("created_at", -1)]
-    return items
+    return UTCJSONResponse(
+        cached("campaigns", 60, lambda: [serialize(x) for x in db["campaign"].find().sort("created_at", -1)])
+    )
 
 
 # ---------------------- Companies upload (CSV) ----------------------
+UPLOAD_BATCH_SIZE = 1000
+
+
+def _insert_companies(campaign_id: str, batch) -> int:
+    # one round-trip per batch instead of one per row
+    now = datetime.now(timezone.utc)
+    base = {"campaign_id": campaign_id, "created_at": now, "updated_at": now}
+    docs = [base | {"company_name": company_name, "linkedin_url": linkedin_url} for company_name, linkedin_url in batch]
+    db["company"].insert_many(docs, ordered=False, bypass_document_validation=True)
+    return len(docs)
+
+
+def _import_companies(campaign_id: str, fileobj) -> int:
+    # stream rows straight from the spooled upload instead of decoding it all into memory
+    reader = csv.reader(codecs.iterdecode(fileobj, "utf-8", errors="ignore"))
+    # resolve the column positions once rather than building a dict per row
+    header = [h.strip() for h in next(reader, [])]
+    ci_name = next((i for i, h in enumerate(header) if h in ("Company Name", "company_name")), None)
+    ci_url = next((i for i, h in enumerate(header) if h in ("Company LinkedIn URL", "linkedin_url")), None)
+    if ci_name is None:
+        return 0
+
+    def rows():
+        for row in reader:
+            if ci_name >= len(row):
+                continue
+            company_name = row[ci_name].strip()
+            if not company_name:
+                continue
+            linkedin_url = row[ci_url] if ci_url is not None and ci_url < len(row) else ""
+            yield company_name, linkedin_url.strip()
+
+    count = 0
+    batch = deque()
+    for company_name, linkedin_url in rows():
+        batch.append((company_name, linkedin_url))
+        if len(batch) >= UPLOAD_BATCH_SIZE:
+            count += _insert_companies(campaign_id, batch)
+            batch.clear()
+    if batch:
+        count += _insert_companies(campaign_id, batch)
+    return count
+
+
 @app.post("/api/campaigns/{campaign_id}/companies/upload")
 async def upload_companies(campaign_id: str, file: UploadFile = File(...)):
     if file.content_type not in ("text/csv", "application/vnd.ms-excel", "application/csv"):
         raise HTTPException(status_code=400, detail="Please upload a CSV file")
-    content = await file.read()
-    text = content.decode("utf-8", errors="ignore")
-    reader = csv.DictReader(io.StringIO(text))
-    count = 0
-    for row in reader:
-        company_name = row.get("Company Name") or row.get("company_name")
-        linkedin_url = row.get("Company LinkedIn URL") or row.get("linkedin_url")
-        if not company_name:
-            continue
-        db["company"].insert_one({
-            "campaign_id": campaign_id,
-            "company_name": company_name.strip(),
-            "linkedin_url": (linkedin_url or "").strip(),
-            "created_at": datetime.now(timezone.utc),
-            "updated_at": datetime.now(timezone.utc),
-        })
-        count += 1
+    # parsing and pymongo writes block, so keep them off the event loop
+    count = await run_in_threadpool(_import_companies, campaign_id, file.file)
+    invalidate(f"companies:{campaign_id}")
     return {"inserted": count}
 
 
 @app.get("/api/campaigns/{campaign_id}/companies")
 def list_companies(campaign_id: str):
-    items = [serialize(x) for x in db["company"].find({"campaign_id": campaign_id}).sort("company_name", 1)]
-    return items
+    return UTCJSONResponse(cached(
+        f"companies:{campaign_id}", 30,
+        lambda: [serialize(x) for x in db["company"].find({"campaign_id": campaign_id}, projection=COMPANY_FIELDS).sort("company_name", 1)],
+    ))
 
 
 # ---------------------- Templates ----------------------
@@ -167,79 +330,120 @@ def upsert_templates(payload: TemplateSet):
         }, "$setOnInsert": {"created_at": datetime.now(timezone.utc)}},
         upsert=True
     )
+    invalidate(f"templates:{payload.campaign_id}")
     doc = db["template"].find_one({"campaign_id": payload.campaign_id})
-    return serialize(doc)
+    return UTCJSONResponse(serialize(doc))
 
 
 @app.get("/api/templates/{campaign_id}")
 def get_templates(campaign_id: str):
-    doc = db["template"].find_one({"campaign_id": campaign_id})
-    return serialize(doc) if doc else {}
+    def load():
+        doc = db["template"].find_one({"campaign_id": campaign_id})
+        return serialize(doc) if doc else {}
+    return UTCJSONResponse(cached(f"templates:{campaign_id}", 30, load))
 
 
 # ---------------------- Prospect search (mock) ----------------------
+FIRST_NAMES = ("Alex", "Jordan", "Taylor", "Casey", "Riley", "Drew", "Chris")
+LAST_NAMES = ("Smith", "Johnson", "Lee", "Brown", "Davis", "Miller")
+
+
 @app.post("/api/campaigns/{campaign_id}/prospects/search")
-def search_and_create_prospects(campaign_id: str, payload: ProspectSearchRequest):
+def search_and_create_prospects(
+    campaign_id: str,
+    payload: ProspectSearchRequest,
+    per_company: int = Query(2, ge=1, le=25),  # two prospects per company by default for demo
+):
     # NOTE: In production, this requires LinkedIn API or a compliant third-party service.
     # Here we mock by generating names per company.
-    companies = list(db["company"].find({"campaign_id": campaign_id}))
+    companies = list(db["company"].find({"campaign_id": campaign_id}, projection={"_id": 0, "company_name": 1}))
     if not companies:
         raise HTTPException(status_code=400, detail="No companies found for this campaign")
 
-    created = 0
+    n = per_company * len(companies)
+    firsts = random.choices(FIRST_NAMES, k=n)
+    lasts = random.choices(LAST_NAMES, k=n)
+    now = datetime.now(timezone.utc)
+    # fields shared by every generated prospect
+    base = {
+        "campaign_id": campaign_id,
+        "job_title": payload.job_title_query,
+        "profile_url": None,
+        "personalized_line": None,
+        "status": "pending",
+        "created_at": now,
+        "updated_at": now,
+        "last_action_at": None,
+    }
+    docs = []
     for c in companies:
-        for i in range(2):  # create two prospects per company for demo
-            first = random.choice(["Alex", "Jordan", "Taylor", "Casey", "Riley", "Drew", "Chris"]) \
-                + random.choice(["", "-Lee", "-Ray"])[:0]
-            last = random.choice(["Smith", "Johnson", "Lee", "Brown", "Davis", "Miller"]) \
-                + random.choice(["", "-Jr"])[:0]
-            db["prospect"].insert_one({
-                "campaign_id": campaign_id,
+        for i in range(per_company):
+            docs.append(base | {
+                "_id": ObjectId(),
                 "company_name": c.get("company_name"),
-                "first_name": first,
-                "last_name": last,
-                "job_title": payload.job_title_query,
-                "profile_url": None,
-                "personalized_line": None,
-                "status": "pending",
-                "created_at": datetime.now(timezone.utc),
-                "updated_at": datetime.now(timezone.utc),
-                "last_action_at": None,
+                "first_name": firsts[len(docs)],
+                "last_name": lasts[len(docs)],
             })
-            created += 1
-    return {"created": created}
+    # one round-trip for the whole batch
+    db["prospect"].insert_many(docs, ordered=False, bypass_document_validation=True)
+    invalidate(f"stats:{campaign_id}")
+    return {"created": len(docs)}
 
 
 @app.get("/api/campaigns/{campaign_id}/prospects")
 def list_prospects(campaign_id: str):
-    items = [serialize(x) for x in db["prospect"].find({"campaign_id": campaign_id}).sort("created_at", -1)]
-    return items
+    cursor = db["prospect"].find({"campaign_id": campaign_id}, projection=PROSPECT_FIELDS).sort("created_at", -1)
+    return stream_json(cursor.batch_size(500))
 
 
 # ---------------------- Stats ----------------------
 @app.get("/api/campaigns/{campaign_id}/stats")
 def campaign_stats(campaign_id: str):
-    total = db["prospect"].count_documents({"campaign_id": campaign_id})
-    requested = db["prospect"].count_documents({"campaign_id": campaign_id, "status": "requested"})
-    followed = db["prospect"].count_documents({"campaign_id": campaign_id, "status": "followed_up"})
-    accepted = db["prospect"].count_documents({"campaign_id": campaign_id, "status": "accepted"})
-    replied = db["prospect"].count_documents({"campaign_id": campaign_id, "status": "replied"})
-    pending = db["prospect"].count_documents({"campaign_id": campaign_id, "status": "pending"})
+    return cached(f"stats:{campaign_id}", 15, lambda: _campaign_stats(campaign_id))
+
+
+def _campaign_stats(campaign_id: str):
+    # single pass over the campaign's prospects, grouped by status
+    counts = {"pending": 0, "requested": 0, "followed_up": 0, "accepted": 0, "replied": 0}
+    total = 0
+    for row in db["prospect"].aggregate([
+        {"$match": {"campaign_id": campaign_id}},
+        {"$group": {"_id": "$status", "n": {"$sum": 1}}},
+    ]):
+        total += row["n"]
+        if row["_id"] in counts:
+            counts[row["_id"]] = row["n"]
     return {
         "total": total,
-        "requests_sent": requested,
-        "followups_sent": followed,
-        "connections_accepted": accepted,
-        "replies_received": replied,
-        "pending": pending,
+        "requests_sent": counts["requested"],
+        "followups_sent": counts["followed_up"],
+        "connections_accepted": counts["accepted"],
+        "replies_received": counts["replied"],
+        "pending": counts["pending"],
     }
 
 
+@app.get("/api/prospects/count")
+def prospect_count(exact: bool = False):
+    # estimated_document_count reads collection metadata instead of walking an index
+    if exact:
+        return {"total": db["prospect"].count_documents({}), "total_is_estimate": False}
+    return {"total": db["prospect"].estimated_document_count(), "total_is_estimate": True}
+
+
 # ---------------------- Automation Engine (simulated) ----------------------
 class AutomationStart(BaseModel):
     campaign_id: str
 
 
+def _flush_automation(msg_ops: list, prosp_ops: list):
+    # bulk_write rejects an empty op list
+    if msg_ops:
+        db["messagelog"].bulk_write(msg_ops, ordered=False)
+    if prosp_ops:
+        db["prospect"].bulk_write(prosp_ops, ordered=False)
+
+
 def process_automation(campaign_id: str):
     template = db["template"].find_one({"campaign_id": campaign_id})
     connection_tmpl = (template or {}).get("connection_template", "Hi {{First Name}}, would love to connect.")
@@ -247,54 +451,76 @@ def process_automation(campaign_id: str):
 
     # Daily limits & randomization (simulation)
     daily_limit = random.randint(10, 20)
-    processed = 0
 
     # 1) Send connection requests to pending prospects
-    cursor = db["prospect"].find({"campaign_id": campaign_id, "status": "pending"}).limit(daily_limit)
-    for p in cursor:
-        if processed >= daily_limit:
-            break
+    msg_ops, prosp_ops = [], []
+    msg_base = {"campaign_id": campaign_id, "type": "connection", "status": "sent"}
+    pending = list(db["prospect"].find({"campaign_id": campaign_id, "status": "pending"}, projection=RENDER_FIELDS).limit(daily_limit))
+    for p in pending:
+        now = datetime.now(timezone.utc)
         # simulate human-like delay window (we just record it, not actually sleep)
-        scheduled_at = datetime.now(timezone.utc) + timedelta(minutes=random.randint(2, 30))
-        content = render_template(connection_tmpl, p)
-        db["messagelog"].insert_one({
-            "campaign_id": campaign_id,
+        scheduled_at = now + timedelta(minutes=random.randint(2, 30))
+        msg_ops.append(InsertOne(msg_base | {
             "prospect_id": str(p["_id"]),
-            "type": "connection",
-            "status": "sent",
             "scheduled_at": scheduled_at,
-            "sent_at": datetime.now(timezone.utc),
-            "content": content,
-        })
-        db["prospect"].update_one({"_id": p["_id"]}, {"$set": {"status": "requested", "last_action_at": datetime.now(timezone.utc), "updated_at": datetime.now(timezone.utc)}})
-        processed += 1
+            "sent_at": now,
+            "content": render_template(connection_tmpl, p),
+        }))
+        prosp_ops.append(UpdateOne({"_id": p["_id"]}, {"$set": {"status": "requested", "last_action_at": now, "updated_at": now}}))
+    _flush_automation(msg_ops, prosp_ops)
 
     # 2) Send follow-ups if 3+ days since request and not accepted
     three_days_ago = datetime.now(timezone.utc) - timedelta(days=3)
-    cursor = db["prospect"].find({
+    msg_ops, prosp_ops = [], []
+    msg_base = {"campaign_id": campaign_id, "type": "followup", "status": "sent"}
+    due = list(db["prospect"].find({
         "campaign_id": campaign_id,
         "status": "requested",
         "last_action_at": {"$lte": three_days_ago}
-    }).limit(daily_limit)
-    for p in cursor:
-        scheduled_at = datetime.now(timezone.utc) + timedelta(minutes=random.randint(5, 45))
-        content = render_template(followup_tmpl, p)
-        db["messagelog"].insert_one({
-            "campaign_id": campaign_id,
+    }, projection=RENDER_FIELDS).sort("last_action_at", 1).limit(daily_limit))
+    for p in due:
+        now = datetime.now(timezone.utc)
+        scheduled_at = now + timedelta(minutes=random.randint(5, 45))
+        msg_ops.append(InsertOne(msg_base | {
             "prospect_id": str(p["_id"]),
-            "type": "followup",
-            "status": "sent",
             "scheduled_at": scheduled_at,
-            "sent_at": datetime.now(timezone.utc),
-            "content": content,
-        })
-        db["prospect"].update_one({"_id": p["_id"]}, {"$set": {"status": "followed_up", "last_action_at": datetime.now(timezone.utc), "updated_at": datetime.now(timezone.utc)}})
+            "sent_at": now,
+            "content": render_template(followup_tmpl, p),
+        }))
+        prosp_ops.append(UpdateOne({"_id": p["_id"]}, {"$set": {"status": "followed_up", "last_action_at": now, "updated_at": now}}))
+    _flush_automation(msg_ops, prosp_ops)
+    invalidate(f"stats:{campaign_id}")
+
+
+# When REDIS_URL is set, automation runs on Dramatiq workers (`dramatiq main`) instead of
+# inside the web process; otherwise it falls back to FastAPI BackgroundTasks.
+process_automation_task = None
+
+if redis_url:
+    import dramatiq
+    from dramatiq.brokers.redis import RedisBroker
+    from dramatiq.rate_limits import ConcurrentRateLimiter
+    from dramatiq.rate_limits.backends import RedisBackend
+
+    dramatiq.set_broker(RedisBroker(url=redis_url))
+    _rate_backend = RedisBackend(url=redis_url)
+
+    @dramatiq.actor(max_retries=0)
+    def process_automation_task(campaign_id: str):
+        # one run per campaign at a time, so the daily limit is never applied twice
+        mutex = ConcurrentRateLimiter(_rate_backend, f"automation:{campaign_id}", limit=1)
+        with mutex.acquire(raise_on_failure=False) as acquired:
+            if acquired:
+                process_automation(campaign_id)
 
 
 @app.post("/api/automation/start")
 def start_automation(payload: AutomationStart, background_tasks: BackgroundTasks):
     # In production, this would enqueue scheduled jobs with randomized delays and enforce daily limits per user.
-    background_tasks.add_task(process_automation, payload.campaign_id)
+    if process_automation_task is not None:
+        process_automation_task.send(payload.campaign_id)
+    else:
+        background_tasks.add_task(process_automation, payload.campaign_id)
     return {"scheduled": True}
 
 
@@ -302,16 +528,19 @@ def start_automation(payload: AutomationStart, background_tasks: BackgroundTasks
 @app.get("/api/inbox")
 def inbox():
     # Only prospects that have status 'replied'
-    items = [serialize(x) for x in db["prospect"].find({"status": "replied"}).sort("updated_at", -1)]
-    return items
+    cursor = db["prospect"].find({"status": "replied"}, projection=PROSPECT_FIELDS).sort("updated_at", -1)
+    return stream_json(cursor.batch_size(500))
 
 
 # ---------------------- Safety & Integration Notice ----------------------
+NOTICE = {
+    "message": "This MVP simulates scheduling and logging only. Real LinkedIn messaging requires integration with the official LinkedIn API or a compliant third-party automation provider that respects LinkedIn's terms of service. The system includes randomized scheduling windows and daily limits for human-like behavior.",
+}
+
+
 @app.get("/api/notice")
 def notice():
-    return {
-        "message": "This MVP simulates scheduling and logging only. Real LinkedIn messaging requires integration with the official LinkedIn API or a compliant third-party automation provider that respects LinkedIn's terms of service. The system includes randomized scheduling windows and daily limits for human-like behavior.",
-    }
+    return NOTICE
 
 
 if __name__ == "__main__":